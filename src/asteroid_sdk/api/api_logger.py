@@ -2,25 +2,33 @@
 Shared logging functionality for API wrappers.
 """
 
-import base64
-import copy
-import json
+import atexit
+import binascii
 import logging
-from typing import Any, Dict
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Any, Dict, Optional
 from uuid import UUID
 
+import orjson
+from pydantic import BaseModel
 from anthropic.types import Message
 from openai.types.chat.chat_completion import ChatCompletion
-from openai.types.chat.chat_completion_message import (
-    ChatCompletionMessage,
-)
 from google.generativeai.types import GenerateContentResponse
 from asteroid_sdk.api.generated.asteroid_api_client import Client
 from asteroid_sdk.api.generated.asteroid_api_client.api.run.create_new_chat import (
     sync_detailed as create_new_chat_sync_detailed,
 )
 from asteroid_sdk.api.generated.asteroid_api_client.models import ChatIds, AsteroidChat, ChatFormat
-from asteroid_sdk.supervision.helpers.model_provider_helper import ModelProviderHelper, Provider
+from asteroid_sdk.supervision.helpers.model_provider_helper import ModelProviderHelper
+
+try:
+    # pybase64 (the `speedups` extra) encodes with SIMD and returns the str directly
+    from pybase64 import b64encode_as_string as _b64encode
+except ImportError:
+    def _b64encode(data: bytes) -> str:
+        # b2a_base64 is the C routine behind base64.b64encode and the output alphabet is plain ASCII
+        return binascii.b2a_base64(data, newline=False).decode("ascii")
 
 provider_to_chat_format = {
     "openai": ChatFormat.OPENAI,
@@ -28,10 +36,25 @@ provider_to_chat_format = {
     "gemini": ChatFormat.GEMINI,
 }
 
+# A single worker keeps background chats in the order they were logged
+_background_log_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="asteroid-api-logger")
+atexit.register(_background_log_executor.shutdown, wait=True)
+# Bound the chats waiting to be sent, so a slow or unreachable API can't grow memory without limit
+MAX_PENDING_BACKGROUND_LOGS = 100
+_background_log_slots = threading.BoundedSemaphore(MAX_PENDING_BACKGROUND_LOGS)
+
+def _background_log_done(future: Future, run_id: UUID) -> None:
+    _background_log_slots.release()
+    # Nothing waits on background logs, so report failures here rather than losing them with the future
+    error = future.exception()
+    if error is not None:
+        logging.warning(f"Failed to log chat for run {run_id}: {str(error)}")
+
 class APILogger:
     def __init__(self, client: Client, model_provider_helper: ModelProviderHelper):
         self.client = client
         self.model_provider_helper = model_provider_helper
+        self._last_background_log: Optional[Future] = None
 
     def log_llm_interaction(
             self,
@@ -39,18 +62,70 @@ class APILogger:
             request_kwargs: Dict[str, Any],
             run_id: UUID,
     ) -> ChatIds:
+        body = self._build_chat(response, request_kwargs)
+
+        # Don't let this chat overtake one still queued in the background
+        if self._last_background_log is not None:
+            wait([self._last_background_log])
+
+        return self._send_chats_to_asteroid_api(run_id, body)
+
+    def log_llm_interaction_in_background(
+            self,
+            response: ChatCompletion | Message | GenerateContentResponse,
+            request_kwargs: Dict[str, Any],
+            run_id: UUID,
+    ) -> Optional[Future]:
+        """
+        Log the interaction without waiting for the API, for when the returned chat IDs are not needed.
+        The payload is serialised before returning, as callers usually append to the request messages straight after.
+        If too many chats are already waiting to be sent, this one is dropped with a warning.
 
+        :param response: The response from the model provider.
+        :param request_kwargs: The request keyword arguments.
+        :param run_id: The unique identifier for the run.
+        :return: A future resolving to the parsed response from the API, or None if the chat was dropped.
+        """
+        # Never wait for a slot, this is called from coroutines on the wrappers' shared event loop
+        if not _background_log_slots.acquire(blocking=False):
+            logging.warning(
+                f"{MAX_PENDING_BACKGROUND_LOGS} chats are already waiting to be logged, dropping the chat for run {run_id}"
+            )
+            return None
+        try:
+            body = self._build_chat(response, request_kwargs)
+        except Exception:
+            _background_log_slots.release()
+            raise
+        try:
+            future = _background_log_executor.submit(self._send_chats_to_asteroid_api, run_id, body)
+        except RuntimeError:
+            _background_log_slots.release()
+            # concurrent.futures stops accepting work before the atexit hooks run, but the wrappers' hooks wait
+            # on supervision tasks that still log their chats, so send those inline rather than dropping them
+            future = Future()
+            try:
+                future.set_result(self._send_chats_to_asteroid_api(run_id, body))
+            except Exception as e:
+                logging.warning(f"Failed to log chat for run {run_id}: {str(e)}")
+                future.set_exception(e)
+            return future
+        future.add_done_callback(lambda done: _background_log_done(done, run_id))
+        self._last_background_log = future
+        return future
+
+    def _build_chat(
+            self, response: ChatCompletion | Message | GenerateContentResponse, request_kwargs: Dict[str, Any]
+    ) -> AsteroidChat:
         response_data_str, request_data_str = self._convert_to_json(response, request_kwargs)
         response_data_base64, request_data_base64 = self._encode_to_base64(response_data_str, request_data_str)
 
-        body = AsteroidChat(
+        return AsteroidChat(
             response_data=response_data_base64,
             request_data=request_data_base64,
             format_=provider_to_chat_format[self.model_provider_helper.get_provider().value]
         )
 
-        return self._send_chats_to_asteroid_api(run_id, body)
-
     def _send_chats_to_asteroid_api(self, run_id: UUID, body: AsteroidChat) -> ChatIds:
         """
         Send the API request to the Asteroid API and handle the response.
@@ -82,13 +157,13 @@ class APILogger:
 
     def _convert_to_json(
             self, response: ChatCompletion | Message | GenerateContentResponse, request_kwargs: Any
-    ) -> tuple[str, str]:
+    ) -> tuple[bytes, bytes | str]:
         """
-        Convert the response and request data to JSON strings.
+        Convert the response and request data to JSON.
 
         :param response: The response data to convert.
-        :param request_kwargs: The request keyword arguments to convert.
-        :return: A tuple containing the response and request data as JSON strings.
+        :param request_kwargs: The request keyword arguments to convert, or the request already serialised to JSON.
+        :return: A tuple containing the response and request data as JSON, bytes unless the request was passed as a string.
         """
         # Convert response_data to a JSON string
         # TODO - Confirm I can remove the bit that I've removed. We were already converting to a dict above
@@ -110,11 +185,17 @@ class APILogger:
         # elif self.model_provider_helper.get_provider() == Provider.GEMINI:
         #     response_data_str = response._pb.SerializeToString()
 
-        response_dict = response.to_dict()
-        response_data_str = json.dumps(response_dict)
+        if isinstance(response, BaseModel):
+            # OpenAI and Anthropic responses are pydantic models, serialise them in pydantic-core directly
+            # rather than building the whole response as a dict with to_dict() first (same options as to_dict)
+            response_data_str = response.model_dump_json(by_alias=True, exclude_unset=True)
+        else:
+            # orjson serialises straight to bytes, saving the str -> bytes round trip before base64 encoding
+            response_data_str = orjson.dumps(response.to_dict())
 
         # Convert request_kwargs to a JSON string
-        if isinstance(request_kwargs, str):
+        if isinstance(request_kwargs, (str, bytes)):
+            # Already serialised by the caller, pass it straight through to the base64 encoding
             request_data_str = request_kwargs
         else:
             # Ensure tool_calls are converted to dictionaries
@@ -123,23 +204,25 @@ class APILogger:
         return response_data_str, request_data_str
 
     def _encode_to_base64(
-            self, response_data_str: str, request_data_str: str
+            self, response_data_str: bytes | str, request_data_str: bytes | str
     ) -> tuple[str, str]:
         """
-        Encode the response and request JSON strings to Base64.
+        Encode the response and request JSON to Base64.
 
-        :param response_data_str: The response data as a JSON string.
-        :param request_data_str: The request data as a JSON string.
+        :param response_data_str: The response data as JSON bytes or string.
+        :param request_data_str: The request data as JSON bytes or string.
         :return: A tuple containing the Base64-encoded response and request data.
         """
-        # Ensure the data is a string
-        if not isinstance(response_data_str, str):
-            response_data_str = str(response_data_str)
-        if not isinstance(request_data_str, str):
-            request_data_str = str(request_data_str)
-
         # Encode to Base64
-        response_data_base64 = base64.b64encode(response_data_str.encode()).decode()
-        request_data_base64 = base64.b64encode(request_data_str.encode()).decode()
+        response_data_base64 = _b64encode(self._to_bytes(response_data_str))
+        request_data_base64 = _b64encode(self._to_bytes(request_data_str))
 
         return response_data_base64, request_data_base64
+
+    @staticmethod
+    def _to_bytes(data: Any) -> bytes:
+        if isinstance(data, bytes):
+            return data
+        if not isinstance(data, str):
+            data = str(data)
+        return data.encode()
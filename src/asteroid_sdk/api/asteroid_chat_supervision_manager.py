@@ -70,7 +70,8 @@ class AsteroidChatSupervisionManager:
         :param request_kwargs: The request keyword arguments used in the OpenAI API call.
         :param run_id: The unique identifier for the run.
         :param execution_mode: The execution mode for the logging.
-        :param completions: The completions object (e.g., the OpenAI.Completions class).
+        :param completions: The completions object (e.g., the OpenAI.Completions class), or None to record
+            rejections without resampling.
         :param args: Additional arguments for the completions.create call.
         :param message_supervisors: The message supervisors to use for supervision.
         :return: Potentially modified response after supervision and resampling, or None.
@@ -80,7 +81,7 @@ class AsteroidChatSupervisionManager:
         supervision_config = get_supervision_config()
         run = supervision_config.get_run_by_id(run_id)
         if not run:
-            print(f"Run not found for ID: {run_id}")
+            logging.warning(f"Run not found for ID: {run_id}")
             return None
 
         supervision_context = run.supervision_context
@@ -97,15 +98,19 @@ class AsteroidChatSupervisionManager:
 
         # Log the interaction
         # It needs to be after the tool calls are processed in case we switch a chat message to tool call
-        create_new_chat_response = self.api_logger.log_llm_interaction(
+        if not response_data_tool_calls:
+            # Nothing to supervise, so the chat IDs aren't needed and the caller doesn't have to wait on the API
+            self.api_logger.log_llm_interaction_in_background(response, request_kwargs, run_id)
+            return None
+
+        # Serialising + base64 encoding large requests and the blocking POST would otherwise stall the event loop
+        create_new_chat_response = await asyncio.to_thread(
+            self.api_logger.log_llm_interaction,
             response,
             request_kwargs,
             run_id,
         )
 
-        if not response_data_tool_calls:
-            return None
-
         choice_ids = create_new_chat_response.choice_ids
 
         # Extract execution settings from the supervision configuration
@@ -2,8 +2,9 @@ import asyncio
 import concurrent.futures
 import copy
 import datetime
+import functools
 import time
-from typing import Any, Dict, List, Optional, Callable
+from typing import Any, Dict, List, Optional, Callable, Tuple
 from uuid import UUID
 
 import jinja2
@@ -36,6 +37,24 @@ from asteroid_sdk.utils.utils import load_template
 
 import logging
 
+# Tools and their supervisor chains are registered up front, so they are cached per runner instead of being
+# fetched again for every tool call
+TOOL_CACHE_TTL_SECONDS = 300
+
+# Decisions that stop a tool call from going ahead, built once instead of as a list literal on every check
+NON_APPROVAL_DECISIONS = frozenset({
+    SupervisionDecisionType.REJECT,
+    SupervisionDecisionType.ESCALATE,
+    SupervisionDecisionType.TERMINATE,
+})
+
+
+@functools.lru_cache(maxsize=None)
+def _get_compiled_template(template_file: str) -> jinja2.Template:
+    # Templates ship with the package and never change, so read and compile each one only once
+    return jinja2.Template(load_template(template_file))
+
+
 class SupervisionRunner:
 
     def __init__(
@@ -47,6 +66,8 @@ class SupervisionRunner:
         self.client = client
         self.api_logger = api_logger
         self.model_provider_helper = model_provider_helper
+        self._tool_cache: Dict[UUID, Tuple[Tool, float]] = {}
+        self._supervisor_chains_cache: Dict[UUID, Tuple[List[SupervisorChain], float]] = {}
 
     async def handle_tool_calls_from_llm_response(
             self,
@@ -61,11 +82,11 @@ class SupervisionRunner:
             supervision_context: SupervisionContext,
             message_supervisors: Optional[List[List[Callable]]] = None
     ) -> AvailableProviderResponses:
-        supervision_config = get_supervision_config()
-        allow_message_modifications = supervision_config.execution_settings.get('allow_message_modifications', False)
-        rejection_policy = supervision_config.execution_settings.get('rejection_policy', 'resample_with_feedback')
-        n_resamples = supervision_config.execution_settings.get('n_resamples', 1)
-        multi_supervisor_resolution = supervision_config.execution_settings.get('multi_supervisor_resolution', 'all_must_approve')
+        execution_settings = get_supervision_config().resolved_execution_settings
+        allow_message_modifications = execution_settings.allow_message_modifications
+        rejection_policy = execution_settings.rejection_policy
+        n_resamples = execution_settings.n_resamples
+        multi_supervisor_resolution = execution_settings.multi_supervisor_resolution
 
         new_response = copy.deepcopy(response)
         # TODO - Check if this is still relevant
@@ -115,7 +136,8 @@ class SupervisionRunner:
                 # NOTE - this does not work currently for multiple tool calls. We're only accepting one tool call for
                 #  OpenAI/Anthropic. We accept multiple (as we can't lock it down) for Gemini, but we'll never hit this
                 #  code with Gemini. When we allow resampling on Gemini, we need to think about this
-                if rejection_policy == RejectionPolicy.RESAMPLE_WITH_FEEDBACK:
+                # Without completions to resample with (the async client in monitoring mode), record the rejection
+                if rejection_policy == RejectionPolicy.RESAMPLE_WITH_FEEDBACK and completions is not None:
                     # Attempt to resample the response with feedback
                     resampled_response = await self.handle_rejection_with_resampling(
                         failed_tool_call=tool_call,
@@ -141,11 +163,10 @@ class SupervisionRunner:
             for supervisor_decisions in decisions:
                 for tool_call_decisions in supervisor_decisions.get('supervisor_decisions'):
                     # We only check the last decision in the chain as that's the one that will be used
-                    if tool_call_decisions[-1].decision in [SupervisionDecisionType.REJECT, SupervisionDecisionType.ESCALATE,
-                                                SupervisionDecisionType.TERMINATE]:
+                    if tool_call_decisions[-1].decision in NON_APPROVAL_DECISIONS:
                         rejection_result = self._create_rejection_result(decisions)
-                        # Log the interaction
-                        self.api_logger.log_llm_interaction(
+                        # Log the interaction, the chat IDs aren't used so there's no need to wait for the API
+                        self.api_logger.log_llm_interaction_in_background(
                             rejection_result,
                             request_kwargs,
                             run_id
@@ -176,8 +197,7 @@ class SupervisionRunner:
             result_info.append(tool_result_info)
 
         # Load and render the feedback message template
-        feedback_template_content = load_template('partial_rejection_message_template.jinja')
-        feedback_template = jinja2.Template(feedback_template_content)
+        feedback_template = _get_compiled_template('partial_rejection_message_template.jinja')
         feedback_message = feedback_template.render(tools=result_info)
 
         return self.model_provider_helper.generate_new_response_with_rejection_message(feedback_message)
@@ -208,7 +228,7 @@ class SupervisionRunner:
         """
 
         # Get the supervisors chains for the tool
-        supervisors_chains = get_supervisor_chains_for_tool(tool_id)
+        supervisors_chains = self.get_supervisor_chains(tool_id)
 
         # Retrieve the tool object
         tool = self.get_tool(tool_id)
@@ -252,13 +272,35 @@ class SupervisionRunner:
         :param tool_id: The ID of the tool.
         :return: The tool object if found, else None.
         """
+        cached = self._tool_cache.get(tool_id)
+        if cached and cached[1] > time.monotonic():
+            return cached[0]
+
         # Retrieve the tool from the API
         tool_response = get_tool.sync_detailed(tool_id=tool_id, client=self.client)
         if tool_response and tool_response.parsed and isinstance(tool_response.parsed, Tool):
+            self._tool_cache[tool_id] = (tool_response.parsed, time.monotonic() + TOOL_CACHE_TTL_SECONDS)
             return tool_response.parsed
         logging.info(f"Failed to get tool for ID {tool_id}. Skipping.")
         return None
 
+    def get_supervisor_chains(self, tool_id: UUID) -> List[SupervisorChain]:
+        """
+        Retrieve the supervisor chains for a tool, reusing recently fetched chains.
+
+        :param tool_id: The ID of the tool.
+        :return: The supervisor chains for the tool.
+        """
+        cached = self._supervisor_chains_cache.get(tool_id)
+        if cached and cached[1] > time.monotonic():
+            return cached[0]
+
+        supervisors_chains = get_supervisor_chains_for_tool(tool_id)
+        # An empty list can also mean the request failed, so only cache chains we actually got back
+        if supervisors_chains:
+            self._supervisor_chains_cache[tool_id] = (supervisors_chains, time.monotonic() + TOOL_CACHE_TTL_SECONDS)
+        return supervisors_chains
+
 
     async def run_supervisor_chains(
             self,
@@ -301,11 +343,7 @@ class SupervisionRunner:
         for chain_decisions in results:
             all_decisions.append(chain_decisions)
             last_decision = chain_decisions[-1]
-            if multi_supervisor_resolution == MultiSupervisorResolution.ALL_MUST_APPROVE and last_decision.decision in [
-                SupervisionDecisionType.ESCALATE,
-                SupervisionDecisionType.REJECT,
-                SupervisionDecisionType.TERMINATE
-            ]:
+            if multi_supervisor_resolution == MultiSupervisorResolution.ALL_MUST_APPROVE and last_decision.decision in NON_APPROVAL_DECISIONS:
                 # If all supervisors must approve and one rejects, we can stop
                 break
             elif last_decision.decision == SupervisionDecisionType.MODIFY:
@@ -351,8 +389,8 @@ class SupervisionRunner:
                 # No decision made, break the chain
                 break
             chain_decisions.append(decision)
-            if decision.decision not in [SupervisionDecisionType.ESCALATE]:
-                # If not escalating, stop processing
+            if decision.decision != SupervisionDecisionType.ESCALATE:
+                # If not escalating (approved, rejected, terminated or modified), stop processing the chain
                 break
         return chain_decisions
 
@@ -382,7 +420,9 @@ class SupervisionRunner:
         :return: The supervisor's decision, or None if no function found.
         """
         # Send supervision request
-        supervision_request_id = send_supervision_request(
+        # The API calls are blocking, run them in a thread so chains gathered in run_supervisor_chains overlap
+        supervision_request_id = await asyncio.to_thread(
+            send_supervision_request,
             tool_call_id=tool_call_id,
             supervisor_id=supervisor.id,
             supervisor_chain_id=supervisor_chain_id,
@@ -411,7 +451,8 @@ class SupervisionRunner:
         logging.info(f"Supervisor decision: {decision.decision}")
 
         # Send supervision result back
-        send_supervision_result(
+        await asyncio.to_thread(
+            send_supervision_result,
             tool_call_id=tool_call_id,
             supervision_request_id=supervision_request_id,
             decision=decision,
@@ -449,14 +490,15 @@ class SupervisionRunner:
         :param message_supervisors: The message supervisors to use for supervision.
         :return: A new ChatCompletionMessage if successful, else None.
         """
-        # Load the resample prompt template
-        resample_prompt_template = load_template('resample_prompt.jinja')
-        resample_prompt_content = jinja2.Template(resample_prompt_template).render()
-
+        # The feedback sent with each resample is reused for the summary if every resample is rejected
+        feedback_messages: List[str] = []
         for resample in range(n_resamples):
             feedback_message = self._get_feedback_message(failed_all_decisions, failed_tool_call)
+            feedback_messages.append(feedback_message)
 
-            resampled_response, resampled_request_kwargs = self.model_provider_helper.resample_response(
+            # The provider clients are synchronous, keep the background loop free while the model call is in flight
+            resampled_response, resampled_request_kwargs = await asyncio.to_thread(
+                self.model_provider_helper.resample_response,
                 feedback_message,
                 args,
                 request_kwargs,
@@ -475,17 +517,24 @@ class SupervisionRunner:
                         model_provider_helper=self.model_provider_helper
                     )
 
-            # Log the interaction
-            resampled_create_new_chat_response = self.api_logger.log_llm_interaction(
+            if not resampled_tool_calls:
+                # There was no tool call found in the resampled response, so we return the message as is
+                # The chat IDs are only needed to supervise tool calls, so don't wait on the API to log it
+                self.api_logger.log_llm_interaction_in_background(
+                    resampled_response,
+                    resampled_request_kwargs,
+                    run_id
+                )
+                return resampled_response
+
+            # Log the interaction, the chat IDs identify the resampled tool call for supervision
+            resampled_create_new_chat_response = await asyncio.to_thread(
+                self.api_logger.log_llm_interaction,
                 resampled_response,
                 resampled_request_kwargs,
                 run_id
             )
 
-            if not resampled_tool_calls:
-                # There was no tool call found in the resampled response, so we return the message as is
-                return resampled_response
-
             resampled_tool_call_id = resampled_create_new_chat_response.choice_ids[0].tool_call_ids[0].tool_call_id
             resampled_tool_id = resampled_create_new_chat_response.choice_ids[0].tool_call_ids[0].tool_id
 
@@ -512,16 +561,13 @@ class SupervisionRunner:
         # Summarize all feedback into one message to send back
 
         # Build the explanations variable
-        # NOTE - Below will fail with n-resamples set to 0, but probably would do this anyway
-        updated_messages = resampled_request_kwargs['messages']
         explanations = "\n".join([
-            f"Resample {idx+1}: {message['content']}"
-            for idx, message in enumerate(updated_messages[-n_resamples:])
+            f"Resample {idx+1}: {message}"
+            for idx, message in enumerate(feedback_messages)
         ])
 
         # Load and render the rejection message template
-        rejection_template_content = load_template('rejection_message_template.jinja')
-        rejection_template = jinja2.Template(rejection_template_content)
+        rejection_template = _get_compiled_template('rejection_message_template.jinja')
         rejection_message = rejection_template.render(
             tool_name=failed_tool_call.tool_name,
             tool_params=failed_tool_call.tool_params,
@@ -538,12 +584,10 @@ class SupervisionRunner:
             f"Chain {chain_number}: Supervisor {supervisor_number_in_chain}: Decision: {decision.decision}, Explanation: {decision.explanation} \n"
             for chain_number, decisions_for_chain in enumerate(failed_all_decisions)
             for supervisor_number_in_chain, decision in enumerate(decisions_for_chain)
-            if decision.decision in [SupervisionDecisionType.REJECT, SupervisionDecisionType.ESCALATE,
-                                     SupervisionDecisionType.TERMINATE]
+            if decision.decision in NON_APPROVAL_DECISIONS
         ])
         # Load and render the feedback message template
-        feedback_template_content = load_template('feedback_message_template.jinja')
-        feedback_template = jinja2.Template(feedback_template_content)
+        feedback_template = _get_compiled_template('feedback_message_template.jinja')
         feedback_message = feedback_template.render(
             tool_name=failed_tool_call.tool_name,
             tool_params=failed_tool_call.tool_params,
@@ -571,14 +615,16 @@ class SupervisionRunner:
         :param decision: The previous decision, if any.
         :return: The decision made by the supervisor.
         """
-        # Call the supervisor function
-        decision = supervisor_func(
+        # Call the supervisor function in a worker thread, sync supervisors such as llm_supervisor make blocking
+        # model calls and would otherwise hold up every other supervision running on the shared event loop
+        decision = await asyncio.to_thread(
+            supervisor_func,
             message=tool_call.message,
             supervision_context=supervision_context,
             supervision_request_id=supervision_request_id,
             previous_decision=decision
         )
-        # If the result is a coroutine, await it
+        # If the result is a coroutine, await it on this loop
         if asyncio.iscoroutine(decision):
             decision = await decision
         return decision
@@ -115,7 +115,7 @@ async def upload_file(run_id: str, file_path: str, file_name: str = None):
         logging.error(f"Error getting signed URL for run {run_id}: {e}")
         raise e
 
-    print(f"Uploading file {file_path} to run {run_id}")
+    logging.info(f"Uploading file {file_path} to run {run_id}")
 
     # Step 2: Perform the actual PUT request (with the PDF or binary data).
     async with aiohttp.ClientSession() as session:
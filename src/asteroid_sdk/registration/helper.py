@@ -10,6 +10,9 @@ import time
 import copy
 import logging
 import json
+import threading
+
+import httpx
 
 from asteroid_sdk.api.generated.asteroid_api_client.client import Client
 from asteroid_sdk.api.generated.asteroid_api_client.models import CreateProjectBody, CreateTaskBody
@@ -57,20 +60,39 @@ from asteroid_sdk.supervision.config import SupervisionDecision, SupervisionDeci
 
 class APIClientFactory:
     """Factory for creating API clients with proper authentication."""
-    _instance: Optional[Client] = None
+    _clients: Dict[Tuple[str, Optional[str]], Client] = {}
+    _lock = threading.Lock()
 
     @classmethod
     def get_client(cls) -> Client:
-        """Get or create a singleton client instance."""
-        if cls._instance is None:
-            cls._instance = Client(
-                base_url=settings.api_url,
-                headers={"X-Asteroid-Api-Key": f"{settings.api_key}"}
-            )
-        return cls._instance
+        """Get or create the shared client for the current API URL and key."""
+        # Keyed on the settings so overriding the API key switches client, and locked so that
+        # wrappers on different threads can't each create their own connection pool
+        key = (settings.api_url, settings.api_key)
+        client = cls._clients.get(key)
+        if client is None:
+            with cls._lock:
+                client = cls._clients.get(key)
+                if client is None:
+                    client = cls._clients[key] = cls.create_client(settings.api_key)
+        return client
+
+    @staticmethod
+    def create_client(api_key: Optional[str]) -> Client:
+        """Create a client that keeps its connections open over HTTP/2 so concurrent
+        supervision and logging calls are multiplexed instead of opening new sockets."""
+        return Client(
+            base_url=settings.api_url,
+            headers={"X-Asteroid-Api-Key": f"{api_key}"},
+            httpx_args={
+                "http2": True,
+                "limits": httpx.Limits(max_keepalive_connections=32),
+            },
+        )
 
  # Define the 'chat_tool' function
 MESSAGE_TOOL_NAME = "message_tool"
+
 def message_tool(message: str) -> None:
     """
     A special tool to represent normal messages without tool calls for supervision purposes.
@@ -402,7 +424,8 @@ def create_supervisor_chain(run_id: UUID, supervision_functions: Optional[List[L
         List[List[UUID]]: A list of lists of supervisor IDs, representing the supervisor chains.
     """
     supervision_config = get_supervision_config()
-    project_id = list(supervision_config.projects.values())[0].project_id
+    # Only the first project is needed, so avoid copying every project into a list to index it
+    project_id = next(iter(supervision_config.projects.values())).project_id
     supervision_context = supervision_config.get_run_by_id(run_id).supervision_context
 
     supervisor_chain_ids: List[List[UUID]] = []
@@ -465,6 +488,23 @@ def register_supervisor(supervisor_name: str,
     Returns:
         UUID: The ID of the registered supervisor.
     """
+    # The same supervisor function is often shared by many tools, only create it once per project.
+    # asteroid_init clears these, so every run registers against the API at least once
+    registered_supervisor_ids = get_supervision_config().registered_supervisor_ids
+    cache_key = (
+        project_id, supervisor_name, supervisor_description, supervisor_type, supervisor_code,
+        tuple(sorted((key, repr(value)) for key, value in supervisor_attributes.items())), supervisor_func
+    )
+    try:
+        supervisor_id = registered_supervisor_ids.get(cache_key)
+    except TypeError:
+        # Unhashable supervisor callables are registered every time
+        cache_key = None
+        supervisor_id = None
+    if supervisor_id is not None:
+        supervision_context.add_local_supervisor(supervisor_id, supervisor_func)
+        return supervisor_id
+
     client = APIClientFactory.get_client()
 
     # Prepare supervisor data for registration
@@ -492,6 +532,8 @@ def register_supervisor(supervisor_name: str,
 
         if isinstance(supervisor_id, UUID):
             supervision_context.add_local_supervisor(supervisor_id, supervisor_func)
+            if cache_key is not None:
+                registered_supervisor_ids[cache_key] = supervisor_id
         else:
             raise ValueError("Invalid supervisor_id: Expected UUID")
 
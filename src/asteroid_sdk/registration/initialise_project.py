@@ -1,11 +1,11 @@
+import asyncio
 from typing import Any, Callable, List, Optional, Dict
 from uuid import UUID
 
 from asteroid_sdk import settings
-from asteroid_sdk.api.generated.asteroid_api_client.client import Client
 from asteroid_sdk.api.generated.asteroid_api_client.models import Status
 from asteroid_sdk.registration.helper import (
-    APIClientFactory, create_run, register_project, register_task, register_tools_and_supervisors_from_registry, submit_run_status,
+    create_run, register_project, register_task, register_tools_and_supervisors_from_registry, submit_run_status,
     register_tool, create_supervisor_chain, register_supervisor_chains
 )
 from asteroid_sdk.supervision.config import ExecutionMode, RejectionPolicy, get_supervision_config
@@ -41,11 +41,7 @@ def asteroid_init(
         logger.info("Overriding API key env variable with provided API key")
         settings.api_key = api_key
 
-        # 2) Overwrite the API client directly
-        APIClientFactory._instance = Client(
-            base_url=settings.api_url,
-            headers={"X-Asteroid-Api-Key": api_key}
-        )
+        # 2) APIClientFactory keys its clients on the API key, so get_client picks up the new key from settings
 
     project_id = register_project(project_name)
     logger.info(f"Registered new project '{project_name}' with ID: {project_id}")
@@ -56,12 +52,40 @@ def asteroid_init(
 
     supervision_config = get_supervision_config()
     supervision_config.set_execution_settings(execution_settings)
+    # Supervisor IDs from an earlier init may belong to another project or API key
+    supervision_config.clear_registered_supervisors()
 
     register_tools_and_supervisors_from_registry(run_id=run_id, 
                                                  message_supervisors=message_supervisors)
 
     return run_id
 
+async def asteroid_init_async(
+        project_name: str = "My Project",
+        task_name: str = "My Agent",
+        run_name: str = "My Run",
+        execution_settings: Dict[str, Any] = {},
+        message_supervisors: Optional[List[Callable]] = None,
+        run_id: Optional[UUID] = None,
+        api_key: Optional[str] = None
+) -> UUID:
+    """
+    Async version of asteroid_init, so start up work like loading models can run alongside registration.
+
+    The project, task and run each depend on the ID of the one before, so they are still registered in order,
+    on a worker thread rather than blocking the event loop. Takes the same arguments as asteroid_init.
+    """
+    return await asyncio.to_thread(
+        asteroid_init,
+        project_name=project_name,
+        task_name=task_name,
+        run_name=run_name,
+        execution_settings=execution_settings,
+        message_supervisors=message_supervisors,
+        run_id=run_id,
+        api_key=api_key,
+    )
+
 def register_tool_with_supervisors(
     tool: Dict[str, Any] | Callable,
     supervision_functions: Optional[List[List[Callable]]] = None,
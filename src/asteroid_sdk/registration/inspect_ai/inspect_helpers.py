@@ -171,7 +171,7 @@ def register_inspect_samples_with_asteroid(tasks: Task, project_id: UUID, approv
     for idx, sample in enumerate(tasks.dataset.samples):
         # We need to assign an ID to each sample and register the task
         if sample.id is None:
-            print(f"Each sample must have an ID, adding {idx} to the ID")
+            logging.warning(f"Each sample must have an ID, adding {idx} to the ID")
             sample.id = f"{idx}"
         task_id = register_task(project_id=project_id, task_name=sample.id)
         run_id = create_run(project_id=project_id, task_id=task_id, run_name=sample.id)
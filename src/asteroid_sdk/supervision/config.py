@@ -3,13 +3,14 @@ import json
 import random
 from enum import Enum
 from threading import Lock
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from uuid import UUID
 from inspect_ai.tool import ToolCall
 from openai.types.chat.chat_completion_message import ChatCompletionMessageToolCall
 from anthropic.types import Message, TextBlock, ToolUseBlock
 from pydantic import BaseModel, Field
 import logging
+from dataclasses import dataclass
 
 from asteroid_sdk.supervision.helpers.model_provider_helper import Provider
 
@@ -77,6 +78,7 @@ class SupervisionContext:
         self.supervised_functions_registry: Dict[str, Dict[str, Any]] = pending_functions or {}
         self.registered_supervisors: Dict[str, UUID] = {}
         self.local_supervisors_by_id: Dict[UUID, Callable] = {}
+        self.local_supervisor_ids_by_name: Dict[str, UUID] = {}
 
     def add_metadata(self, key: str, value: Any):
         self.metadata[key] = value
@@ -254,6 +256,8 @@ class SupervisionContext:
     def add_local_supervisor(self, supervisor_id: UUID, supervisor_func: Callable):
         """Add a supervisor function to the config."""
         self.local_supervisors_by_id[supervisor_id] = supervisor_func
+        # Keep the first ID registered for a name, same as scanning local_supervisors_by_id in order
+        self.local_supervisor_ids_by_name.setdefault(supervisor_func.__name__, supervisor_id)
 
     def get_supervisor_func_by_id(self, supervisor_id: UUID) -> Optional[Callable]:
         """Retrieve a supervisor function by its ID."""
@@ -261,10 +265,7 @@ class SupervisionContext:
 
     def get_supervisor_id_by_name(self, supervisor_name: str) -> Optional[UUID]:
         """Retrieve a supervisor function by its function."""
-        for supervisor_id, func in self.local_supervisors_by_id.items():
-            if func.__name__ == supervisor_name:
-                return supervisor_id
-        return None
+        return self.local_supervisor_ids_by_name.get(supervisor_name)
 
 class Run(BaseModel):
     run_id: UUID
@@ -285,6 +286,26 @@ class Project(BaseModel):
     tasks: Dict[str, Task] = Field(default_factory=dict)
 
 
+@dataclass(frozen=True, slots=True)
+class ExecutionSettings:
+    """Execution settings resolved once from the dict passed to asteroid_init."""
+    allow_message_modifications: bool = False
+    rejection_policy: str = RejectionPolicy.RESAMPLE_WITH_FEEDBACK
+    n_resamples: int = 1
+    multi_supervisor_resolution: str = MultiSupervisorResolution.ALL_MUST_APPROVE
+
+    @classmethod
+    def from_dict(cls, execution_settings: Dict[str, Any]) -> "ExecutionSettings":
+        return cls(
+            allow_message_modifications=execution_settings.get('allow_message_modifications', False),
+            rejection_policy=execution_settings.get('rejection_policy', RejectionPolicy.RESAMPLE_WITH_FEEDBACK),
+            n_resamples=execution_settings.get('n_resamples', 1),
+            multi_supervisor_resolution=execution_settings.get(
+                'multi_supervisor_resolution', MultiSupervisorResolution.ALL_MUST_APPROVE
+            ),
+        )
+
+
 class SupervisionConfig:
     def __init__(self):
         self.global_supervision_functions: List[Callable] = []
@@ -292,6 +313,7 @@ class SupervisionConfig:
         self.llm = None
         self.client = None  # Sentinel API client
         self.execution_settings: Dict[str, Any] = {}
+        self.resolved_execution_settings = ExecutionSettings()
 
         # Hierarchical projects structure
         self.projects: Dict[str, Project] = {}  # Mapping from project_name to Project
@@ -301,6 +323,8 @@ class SupervisionConfig:
         self.runs_by_name: Dict[str, List[Run]] = {}  # New mapping for runs by name
         self.lock = Lock()  # For thread safety
         self.pending_supervised_functions: Dict[str, Dict[str, Any]] = {}
+        # Supervisor IDs keyed by project and supervisor definition, see register_supervisor
+        self.registered_supervisor_ids: Dict[Tuple[Any, ...], UUID] = {}
 
     def set_global_supervision_functions(self, functions: List[Callable]):
         self.global_supervision_functions = functions
@@ -310,6 +334,12 @@ class SupervisionConfig:
 
     def set_execution_settings(self, execution_settings: Dict[str, Any]):
         self.execution_settings = execution_settings
+        # Resolve the defaults here so the supervision path doesn't repeat the lookups on every response
+        self.resolved_execution_settings = ExecutionSettings.from_dict(execution_settings)
+
+    def clear_registered_supervisors(self):
+        """Forget the supervisors registered so far, so the next registration creates them again."""
+        self.registered_supervisor_ids = {}
 
     # Project methods
     def add_project(self, project_name: str, project_id: UUID):
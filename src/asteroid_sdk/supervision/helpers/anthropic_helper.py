@@ -1,7 +1,7 @@
 import copy
-import json
 from typing import List
 
+import orjson
 from anthropic.types import Message, ToolUseBlock, TextBlock, Usage
 from openai.types.chat import ChatCompletionMessage
 
@@ -80,21 +80,34 @@ class AnthropicSupervisionHelper:
         return Provider.ANTHROPIC
 
     # TODO - Clean this up, just copied the method from main code
-    def convert_model_kwargs_to_json(self, request_kwargs: Message) -> str:
+    def convert_model_kwargs_to_json(self, request_kwargs: Message) -> bytes:
         messages = request_kwargs.get("messages", [])
+        converted_messages = None
         for idx, message in enumerate(messages):
             if isinstance(message, ChatCompletionMessage):
-                request_kwargs['messages'][idx] = message.to_dict()
+                converted = message.to_dict()
             else:
-                tool_calls = message.get("tool_calls", [])
-                if tool_calls:
-                    request_kwargs["messages"][idx]["tool_calls"] = [
-                        t.to_dict() if hasattr(t, 'to_dict') else t for t in tool_calls
-                    ]
-        return json.dumps(request_kwargs)
+                tool_calls = message.get("tool_calls")
+                # Most histories only hold plain dicts, leave those messages untouched
+                if not tool_calls or all(type(t) is dict for t in tool_calls):
+                    continue
+                converted = dict(message)
+                converted["tool_calls"] = [
+                    t if isinstance(t, dict) else t.to_dict() for t in tool_calls
+                ]
+            # Copy-on-write so the caller's request_kwargs are never mutated
+            if converted_messages is None:
+                converted_messages = list(messages)
+            converted_messages[idx] = converted
+
+        if converted_messages is None:
+            return orjson.dumps(request_kwargs, option=orjson.OPT_NON_STR_KEYS)
+        return orjson.dumps({**request_kwargs, "messages": converted_messages}, option=orjson.OPT_NON_STR_KEYS)
 
     def resample_response(self, feedback_message, args, request_kwargs, completions):
-        copied_kwargs = copy.deepcopy(request_kwargs)
+        # Only the messages list is changed, so a shallow copy of it is enough to leave the original request intact
+        copied_kwargs = dict(request_kwargs)
+        copied_kwargs['messages'] = list(request_kwargs['messages'])
         copied_kwargs['messages'].append({
             "role": "user",
             "content": feedback_message
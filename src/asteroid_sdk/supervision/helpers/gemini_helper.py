@@ -1,7 +1,7 @@
 import copy
-import json
 from typing import List
 
+import orjson
 from google.ai.generativelanguage_v1beta import Content, Part, Candidate
 from google.ai.generativelanguage_v1beta import FunctionCall, Candidate as TypeImport, \
     GenerateContentResponse as BetaContent
@@ -82,7 +82,7 @@ class GeminiHelper:
     def get_provider(self) -> Provider:
         return Provider.GEMINI
 
-    def convert_model_kwargs_to_json(self, request_kwargs: dict) -> str:
+    def convert_model_kwargs_to_json(self, request_kwargs: dict) -> bytes:
         kwargs_to_convert = copy.deepcopy(request_kwargs)
         contents = kwargs_to_convert.get('contents')
         for i, part in enumerate(contents):
@@ -99,12 +99,13 @@ class GeminiHelper:
                 tools_list.append(tool_dict)
         kwargs_to_convert['tools'] = tools_list
 
-        return json.dumps(kwargs_to_convert)
+        return orjson.dumps(kwargs_to_convert, option=orjson.OPT_NON_STR_KEYS)
 
     # TODO - maybe change the args here to stop us passing in the client
     def resample_response(self, feedback_message, args, request_kwargs, completions: GenerativeModel):
-        copied_kwargs = copy.deepcopy(request_kwargs)
-        current_contents = copied_kwargs["contents"]
+        # Only the contents list is changed, so a shallow copy of it is enough to leave the original request intact
+        copied_kwargs = dict(request_kwargs)
+        current_contents = list(request_kwargs["contents"])
         current_contents.append({"role": "user", 'parts': [{"text": feedback_message}]})
         copied_kwargs["contents"] = current_contents
 
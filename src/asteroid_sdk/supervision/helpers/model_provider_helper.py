@@ -31,7 +31,7 @@ class ModelProviderHelper(Protocol):
         ...
     def get_provider(self) -> Provider:
         ...
-    def convert_model_kwargs_to_json(self, response: AvailableProviderMessageTypes) -> str:
+    def convert_model_kwargs_to_json(self, response: AvailableProviderMessageTypes) -> bytes:
         ...
     def resample_response(self, feedback_message, args, request_kwargs, completions):
         pass
@@ -4,6 +4,7 @@ import json
 from typing import List
 from uuid import uuid4
 
+import orjson
 from openai.types.chat import ChatCompletion, ChatCompletionMessageToolCall, ChatCompletionMessage
 from openai.types.chat.chat_completion import Choice
 from openai.types.chat.chat_completion_message_tool_call import Function
@@ -18,17 +19,19 @@ class OpenAiSupervisionHelper:
     def get_tool_call_from_response(self, response: ChatCompletion) -> List[ToolCall]:
         tools = []
 
-        if not response.choices[0].message.tool_calls:
+        # Walk down to the message once rather than re-resolving it for every tool call
+        message = response.choices[0].message
+        if not message.tool_calls:
             return tools
 
-        for tool_call in response.choices[0].message.tool_calls:
-            arguments = json.loads(tool_call.function.arguments)
+        for tool_call in message.tool_calls:
+            arguments = orjson.loads(tool_call.function.arguments)
             call = ToolCall(
                 message_id=tool_call.id,
                 tool_name=tool_call.function.name,
                 tool_params=arguments,
                 language_model_tool_call=tool_call,
-                message=copy.deepcopy(response.choices[0].message)
+                message=copy.deepcopy(message)
             )
             tools.append(call)
         return tools
@@ -55,7 +58,7 @@ class OpenAiSupervisionHelper:
 
     def generate_message_from_fake_tool_call(self, response: ChatCompletion) -> ChatCompletion:
         if response.choices[0].message.tool_calls and isinstance(response.choices[0].message.tool_calls[0], ChatCompletionMessageToolCall) and response.choices[0].message.tool_calls[0].function.name == MESSAGE_TOOL_NAME:
-            response.choices[0].message.content = json.loads(response.choices[0].message.tool_calls[0].function.arguments)["message"]
+            response.choices[0].message.content = orjson.loads(response.choices[0].message.tool_calls[0].function.arguments)["message"]
             response.choices[0].message.tool_calls = []
         return response
 
@@ -96,21 +99,35 @@ class OpenAiSupervisionHelper:
         return Provider.OPENAI
 
     # TODO - Clean this up, just copied the method from main code
-    def convert_model_kwargs_to_json(self, request_kwargs: ChatCompletion) -> str:
+    def convert_model_kwargs_to_json(self, request_kwargs: ChatCompletion) -> bytes:
         messages = request_kwargs.get("messages", [])
+        converted_messages = None
         for idx, message in enumerate(messages):
             if isinstance(message, ChatCompletionMessage):
-                request_kwargs['messages'][idx] = message.to_dict()
+                converted = message.to_dict()
             else:
-                tool_calls = message.get("tool_calls", [])
-                if tool_calls:
-                    request_kwargs["messages"][idx]["tool_calls"] = [
-                        t.to_dict() if hasattr(t, 'to_dict') else t for t in tool_calls
-                    ]
-        return json.dumps(request_kwargs)
+                tool_calls = message.get("tool_calls")
+                # Most histories only hold plain dicts, leave those messages untouched
+                if not tool_calls or all(type(t) is dict for t in tool_calls):
+                    continue
+                converted = dict(message)
+                converted["tool_calls"] = [
+                    t if isinstance(t, dict) else t.to_dict() for t in tool_calls
+                ]
+            # Copy-on-write so the caller's request_kwargs are never mutated
+            if converted_messages is None:
+                converted_messages = list(messages)
+            converted_messages[idx] = converted
+
+        # Like json.dumps, accept non-str keys such as those in logit_bias={50256: -100}
+        if converted_messages is None:
+            return orjson.dumps(request_kwargs, option=orjson.OPT_NON_STR_KEYS)
+        return orjson.dumps({**request_kwargs, "messages": converted_messages}, option=orjson.OPT_NON_STR_KEYS)
 
     def resample_response(self, feedback_message, args, request_kwargs, completions):
-        copied_kwargs = copy.deepcopy(request_kwargs)
+        # Only the messages list is changed, so a shallow copy of it is enough to leave the original request intact
+        copied_kwargs = dict(request_kwargs)
+        copied_kwargs['messages'] = list(request_kwargs['messages'])
         copied_kwargs['messages'].append({
             "role": "user",
             "content": feedback_message
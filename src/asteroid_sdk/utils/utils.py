@@ -1,4 +1,5 @@
 from typing import Any, get_origin, get_args, Callable, Any, Union, Optional
+import functools
 import random
 import string
 import inspect
@@ -53,6 +54,18 @@ def create_random_value(return_type: type) -> Any:
 
 def get_function_code(func: Callable) -> str:
     """Retrieve the source code of a function."""
+    try:
+        return _get_function_code_cached(func)
+    except TypeError:
+        # Unhashable callables can't be cached
+        return _get_function_code(func)
+
+@functools.lru_cache(maxsize=1024)
+def _get_function_code_cached(func: Callable) -> str:
+    # getsource reads and tokenises the source file, and tools and supervisors are registered again for every run
+    return _get_function_code(func)
+
+def _get_function_code(func: Callable) -> str:
     try:
         return inspect.getsource(func)
     except Exception as e:
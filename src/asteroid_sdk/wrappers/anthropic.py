@@ -18,12 +18,12 @@ from asteroid_sdk.api.asteroid_chat_supervision_manager import (
     AsteroidChatSupervisionManager,
     AsteroidLoggingError,
 )
-from asteroid_sdk.api.generated.asteroid_api_client import Client
 from asteroid_sdk.api.supervision_runner import SupervisionRunner
 from asteroid_sdk.settings import settings
 from asteroid_sdk.supervision.config import ExecutionMode
 from asteroid_sdk.supervision.helpers.anthropic_helper import AnthropicSupervisionHelper
 from asteroid_sdk.interaction.helper import wait_for_unpaused
+from asteroid_sdk.registration.helper import APIClientFactory
 
 # Conditionally import Langfuse if enabled (modeled after wrappers/openai.py)
 if settings.langfuse_enabled:
@@ -210,9 +210,9 @@ class CompletionsWrapper:
             future = schedule_task(self.chat_supervision_manager.log_request(kwargs, self.run_id))
             future.result()  # Wait for the result
         except AsteroidLoggingError as e:
-            print(f"Warning: Failed to log request: {str(e)}")
+            logging.warning(f"Failed to log request: {str(e)}")
         except Exception as e:
-            print(f"Error while logging request: {str(e)}")
+            logging.error(f"Error while logging request: {str(e)}")
 
         @observe(name="anthropic_wrapper_create_sync")
         def create_completion(*args, **kwargs):
@@ -242,7 +242,7 @@ class CompletionsWrapper:
             tb = e.__traceback__
             while tb and tb.tb_next:
                 tb = tb.tb_next
-            print(f"Error in file {tb.tb_frame.f_code.co_filename} at line {tb.tb_lineno}: {str(e)}")
+            logging.error(f"Error in file {tb.tb_frame.f_code.co_filename} at line {tb.tb_lineno}: {str(e)}")
 
         return response
 
@@ -262,10 +262,7 @@ def asteroid_anthropic_client(
         raise ValueError("Invalid Anthropic client: missing messages attribute")
 
     try:
-        client = Client(
-            base_url=settings.api_url,
-            headers={"X-Asteroid-Api-Key": f"{settings.api_key}"},
-        )
+        client = APIClientFactory.get_client()
         supervision_manager = _create_supervision_manager(client)
 
         completions_wrapper = CompletionsWrapper(
@@ -19,9 +19,7 @@ from asteroid_sdk.api.asteroid_chat_supervision_manager import (
     AsteroidChatSupervisionManager,
     AsteroidLoggingError,
 )
-from asteroid_sdk.api.generated.asteroid_api_client import Client
 from asteroid_sdk.api.supervision_runner import SupervisionRunner
-from asteroid_sdk.settings import settings
 from asteroid_sdk.supervision.config import (
     ExecutionMode,
     RejectionPolicy,
@@ -29,6 +27,7 @@ from asteroid_sdk.supervision.config import (
 )
 from asteroid_sdk.supervision.helpers.gemini_helper import GeminiHelper
 from asteroid_sdk.interaction.helper import wait_for_unpaused
+from asteroid_sdk.registration.helper import APIClientFactory
 
 # Create a background event loop
 background_loop = asyncio.new_event_loop()
@@ -63,6 +62,13 @@ def schedule_task(coro):
     future.add_done_callback(task_done)
     return future  # Return future so caller can wait if needed
 
+def run_on_background_loop(coro):
+    """Run a coroutine on the background loop and wait for its result, or on a new loop once shutdown has started."""
+    future = schedule_task(coro)
+    if future is None:
+        return asyncio.run(coro)
+    return future.result()
+
 def task_done(fut):
     tasks.discard(fut)
     try:
@@ -183,10 +189,10 @@ class GeminiGenerateContentWrapper:
     ) -> Any:
         # Log the entire request payload synchronously
         try:
-            # Use asyncio.run for one-off async calls
-            asyncio.run(self.chat_supervision_manager.log_request(kwargs, self.run_id))
+            # Run on the shared background loop rather than spinning up a new event loop with asyncio.run
+            run_on_background_loop(self.chat_supervision_manager.log_request(kwargs, self.run_id))
         except AsteroidLoggingError as e:
-            print(f"Warning: Failed to log request: {str(e)}")
+            logging.warning(f"Failed to log request: {str(e)}")
         except Exception as e:
             logging.error(f"Unexpected error during request logging: {str(e)}")
             traceback.print_exc()
@@ -195,8 +201,8 @@ class GeminiGenerateContentWrapper:
         response = self._gemini_model.generate_content(*args, **kwargs)
 
         try:
-            # Use asyncio.run for the supervision handling
-            supervised_response = asyncio.run(
+            # Run the supervision handling on the shared background loop and wait for it
+            supervised_response = run_on_background_loop(
                 self.chat_supervision_manager.handle_language_model_interaction(
                     response=response,
                     request_kwargs=kwargs,
@@ -208,11 +214,12 @@ class GeminiGenerateContentWrapper:
                 )
             )
             if supervised_response is not None:
-                print(f"New response: {supervised_response}")
+                if logging.getLogger().isEnabledFor(logging.DEBUG):
+                    logging.debug(f"New response: {supervised_response}")
                 return supervised_response
             return response
         except Exception as e:
-            print(f"Warning: Failed to process supervision: {str(e)}")
+            logging.warning(f"Failed to process supervision: {str(e)}")
             traceback.print_exc()
             return response
 
@@ -239,10 +246,7 @@ def asteroid_gemini_wrap_model_generate_content(
 
     try:
         # TODO - Clean up where this is instantiated
-        client = Client(
-            base_url=settings.api_url,
-            headers={"X-Asteroid-Api-Key": f"{settings.api_key}"},
-        )
+        client = APIClientFactory.get_client()
         supervision_manager = _create_supervision_manager(client)
         original_model = deepcopy(model)
         wrapper = GeminiGenerateContentWrapper(
@@ -8,10 +8,11 @@ import threading
 import traceback
 import time
 import atexit
-from typing import Any, Callable, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 from uuid import UUID
 
-from openai import OpenAIError
+from openai import AsyncOpenAI
+from openai.types.chat import ChatCompletion
 
 from asteroid_sdk.api.api_logger import APILogger
 from asteroid_sdk.api.asteroid_chat_supervision_manager import (
@@ -91,6 +92,22 @@ def schedule_task(coro):
     return future  # Return future so caller can wait if needed
 
 
+def run_on_background_loop(coro):
+    """Run a coroutine on the background loop and wait for its result, or on a new loop once shutdown has started."""
+    future = schedule_task(coro)
+    if future is None:
+        return asyncio.run(coro)
+    return future.result()
+
+
+async def wait_on_background_loop(coro):
+    """Async version of run_on_background_loop, runs on the caller's loop once shutdown has started."""
+    future = schedule_task(coro)
+    if future is None:
+        return await coro
+    return await asyncio.wrap_future(future)
+
+
 def task_done(fut):
     tasks.discard(fut)
     try:
@@ -126,6 +143,81 @@ def shutdown_background_loop():
 atexit.register(shutdown_background_loop)
 
 
+# Only warn once per process, agent loops call create() with the same kwargs on every turn
+_warned_parallel_tool_calls_unsupported = False
+
+
+def _warn_parallel_tool_calls_unsupported():
+    global _warned_parallel_tool_calls_unsupported
+    if _warned_parallel_tool_calls_unsupported:
+        return
+    _warned_parallel_tool_calls_unsupported = True
+    logging.warning(
+        "Parallel tool calls are not supported, setting parallel_tool_calls=False"
+    )
+
+
+class _SupervisedStream:
+    """Passes streamed chunks straight through to the caller, then hands the assembled completion to supervision."""
+
+    def __init__(self, stream: Any, state: Any, on_complete: Callable[[ChatCompletion], None]):
+        self._stream = stream
+        self._iterator = iter(stream)
+        self._state = state
+        self._on_complete = on_complete
+        self._completed = False
+
+    def __iter__(self):
+        return self
+
+    def __next__(self) -> Any:
+        try:
+            chunk = next(self._iterator)
+        except StopIteration:
+            self._complete()
+            raise
+        self._state.handle_chunk(chunk)
+        return chunk
+
+    def _complete(self) -> None:
+        if self._completed:
+            return
+        self._completed = True
+        try:
+            self._on_complete(_chat_completion_from_snapshot(self._state.current_completion_snapshot))
+        except Exception as e:
+            # Supervision problems must not break the caller's iteration over the stream
+            logging.warning(f"Failed to supervise streamed response: {str(e)}")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self) -> None:
+        self._stream.close()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._stream, name)
+
+
+def _chat_completion_from_snapshot(snapshot: Any) -> ChatCompletion:
+    """
+    Build a plain ChatCompletion from the stream accumulator's snapshot.
+    get_final_completion() isn't used as it raises for the length and content_filter finish reasons, and both
+    return a ParsedChatCompletion whose parsed fields and chunk indexes aren't part of a ChatCompletion.
+    """
+    data = snapshot.model_dump(exclude_unset=True)
+    for choice in data["choices"]:
+        message = choice["message"]
+        message.pop("parsed", None)
+        for tool_call in message.get("tool_calls") or []:
+            tool_call.pop("index", None)
+            tool_call["function"].pop("parsed_arguments", None)
+    return ChatCompletion.model_validate(data)
+
+
 class CompletionsWrapper:
     """Wraps chat completions with logging and supervision capabilities."""
 
@@ -153,13 +245,18 @@ class CompletionsWrapper:
         
         # If parallel tool calls not set to false (or doesn't exist, defaulting to true), then raise an error.
         # Parallel tool calls do not work at the moment due to conflicts when trying to 'resample'
-        if kwargs.get("tools", None) and kwargs.get("parallel_tool_calls", True):
+        if kwargs.get("tools") and kwargs.get("parallel_tool_calls", True):
             # parallel_tool_calls is only supported by openai when tools are specified
-            logging.warning(
-                "Parallel tool calls are not supported, setting parallel_tool_calls=False"
-            )
+            _warn_parallel_tool_calls_unsupported()
             kwargs["parallel_tool_calls"] = False
 
+        if kwargs.get("stream"):
+            if self.execution_mode != ExecutionMode.MONITORING:
+                raise ValueError("Streaming responses can only be supervised in monitoring mode")
+            return self.create_stream_with_async_supervision(
+                *args, message_supervisors=message_supervisors, **kwargs
+            )
+
         # Depending on the execution mode, handle supervision synchronously
         if self.execution_mode == ExecutionMode.MONITORING:
             # Run in monitoring mode (asynchronous supervision)
@@ -187,6 +284,35 @@ class CompletionsWrapper:
 
         response = create_completion(*args, **kwargs)
 
+        self._schedule_supervision(response, args, kwargs, message_supervisors)
+        return response
+
+    def create_stream_with_async_supervision(
+        self,
+        *args,
+        message_supervisors: Optional[List[List[Callable]]] = None,
+        **kwargs,
+    ) -> Any:
+        # The stream accumulator needs openai>=1.40, so it's only imported when a stream is supervised
+        from openai.lib.streaming.chat import ChatCompletionStreamState
+
+        state = ChatCompletionStreamState()
+        stream = self._completions.create(*args, **kwargs)
+        # Supervision gets the request as if it wasn't streamed, so any resamples return a ChatCompletion
+        supervision_kwargs = {k: v for k, v in kwargs.items() if k not in ("stream", "stream_options")}
+
+        def on_complete(response: ChatCompletion):
+            self._schedule_supervision(response, args, supervision_kwargs, message_supervisors)
+
+        return _SupervisedStream(stream, state, on_complete)
+
+    def _schedule_supervision(
+        self,
+        response: Any,
+        args: Any,
+        kwargs: Dict[str, Any],
+        message_supervisors: Optional[List[List[Callable]]],
+    ) -> None:
         async def supervision_task():
             try:
                 # Asynchronously log the request
@@ -213,7 +339,6 @@ class CompletionsWrapper:
 
         # Schedule the supervision task and get future
         schedule_task(supervision_task())
-        return response
 
     def create_sync(
         self,
@@ -223,8 +348,8 @@ class CompletionsWrapper:
     ) -> Any:
         # Log the entire request payload synchronously
         try:
-            # Use asyncio.run for one-off async calls
-            asyncio.run(self.chat_supervision_manager.log_request(kwargs, self.run_id))
+            # Run on the shared background loop rather than spinning up a new event loop with asyncio.run
+            run_on_background_loop(self.chat_supervision_manager.log_request(kwargs, self.run_id))
         except AsteroidLoggingError as e:
             logging.warning(f"Failed to log request: {str(e)}")
 
@@ -235,24 +360,124 @@ class CompletionsWrapper:
 
         response = create_completion(*args, **kwargs)
 
-        try:
-            # Use asyncio.run for the supervision handling
-            supervised_response = asyncio.run(
-                self.chat_supervision_manager.handle_language_model_interaction(
-                    response=response,
-                    request_kwargs=kwargs,
-                    run_id=self.run_id,
-                    execution_mode=self.execution_mode,
-                    completions=self._completions,
-                    args=args,
-                    message_supervisors=message_supervisors,
-                )
+        # Run the supervision handling on the shared background loop and wait for it,
+        # errors from resampling (including OpenAIError) propagate to the caller unchanged
+        supervised_response = run_on_background_loop(
+            self.chat_supervision_manager.handle_language_model_interaction(
+                response=response,
+                request_kwargs=kwargs,
+                run_id=self.run_id,
+                execution_mode=self.execution_mode,
+                completions=self._completions,
+                args=args,
+                message_supervisors=message_supervisors,
             )
-            if supervised_response is not None:
-                return supervised_response
+        )
+        if supervised_response is not None:
+            return supervised_response
+        return response
+
+
+class _BlockingCompletions:
+    """Sync view of async completions, for resampling from the supervision worker threads.
+
+    The async client's connections belong to the caller's event loop, so requests are run there.
+    """
+
+    def __init__(self, completions: Any, loop: asyncio.AbstractEventLoop):
+        self._completions = completions
+        self._loop = loop
+
+    def create(self, *args, **kwargs) -> Any:
+        return asyncio.run_coroutine_threadsafe(self._completions.create(*args, **kwargs), self._loop).result()
+
+
+class AsyncCompletionsWrapper:
+    """Wraps async chat completions with logging and supervision capabilities."""
+
+    def __init__(
+        self,
+        completions: Any,
+        chat_supervision_manager: AsteroidChatSupervisionManager,
+        run_id: UUID,
+        execution_mode: str = "supervision",
+    ):
+        self._completions = completions
+        self.chat_supervision_manager = chat_supervision_manager
+        self.run_id = run_id
+        self.execution_mode = execution_mode
+
+    async def create(
+        self,
+        *args,
+        message_supervisors: Optional[List[List[Callable]]] = None,
+        **kwargs,
+    ) -> Any:
+        # Wait for unpaused state before proceeding, without blocking the caller's event loop
+        await wait_on_background_loop(wait_for_unpaused(self.run_id))
+
+        # See CompletionsWrapper.create
+        if kwargs.get("tools") and kwargs.get("parallel_tool_calls", True):
+            _warn_parallel_tool_calls_unsupported()
+            kwargs["parallel_tool_calls"] = False
+
+        if kwargs.get("stream"):
+            raise ValueError("Streaming responses can't be supervised with the async OpenAI client")
+
+        if self.execution_mode not in (ExecutionMode.MONITORING, ExecutionMode.SUPERVISION):
+            raise ValueError(f"Invalid execution mode: {self.execution_mode}")
+
+        response = await self._completions.create(*args, **kwargs)
+
+        if self.execution_mode == ExecutionMode.MONITORING:
+            async def supervision_task():
+                try:
+                    await self.chat_supervision_manager.log_request(kwargs, self.run_id)
+                except AsteroidLoggingError as e:
+                    logging.warning(f"Failed to log request: {str(e)}")
+                except Exception as e:
+                    logging.error(f"Unexpected error during request logging: {str(e)}")
+                    traceback.print_exc()
+
+                try:
+                    await self.chat_supervision_manager.handle_language_model_interaction(
+                        response=response,
+                        request_kwargs=kwargs,
+                        run_id=self.run_id,
+                        execution_mode=self.execution_mode,
+                        # Resamples would have to run on the caller's event loop, which may be gone by the time
+                        # supervision finishes, so rejections are only recorded
+                        completions=None,
+                        args=args,
+                        message_supervisors=message_supervisors,
+                    )
+                except Exception as e:
+                    logging.warning(f"Failed to process supervision: {str(e)}")
+                    traceback.print_exc()
+
+            schedule_task(supervision_task())
             return response
-        except OpenAIError as e:
-            raise e
+
+        try:
+            await wait_on_background_loop(self.chat_supervision_manager.log_request(kwargs, self.run_id))
+        except AsteroidLoggingError as e:
+            logging.warning(f"Failed to log request: {str(e)}")
+
+        # Supervision runs on the background loop while this loop waits on it, so resamples can be sent back here
+        supervised_response = await wait_on_background_loop(
+            self.chat_supervision_manager.handle_language_model_interaction(
+                response=response,
+                request_kwargs=kwargs,
+                run_id=self.run_id,
+                execution_mode=self.execution_mode,
+                completions=_BlockingCompletions(self._completions, asyncio.get_running_loop()),
+                args=args,
+                message_supervisors=message_supervisors,
+            )
+        )
+        if supervised_response is not None:
+            return supervised_response
+        return response
 
 
 def asteroid_openai_client(
@@ -260,6 +485,7 @@ def asteroid_openai_client(
 ) -> Any:
     """
     Wraps an OpenAI client instance with logging capabilities and registers supervisors.
+    Both OpenAI and AsyncOpenAI clients are supported.
     """
     if not openai_client:
         raise ValueError("Client is required")
@@ -267,13 +493,23 @@ def asteroid_openai_client(
     if not hasattr(openai_client, "chat"):
         raise ValueError("Invalid OpenAI client: missing chat attribute")
 
+    wrapper_class = AsyncCompletionsWrapper if isinstance(openai_client, AsyncOpenAI) else CompletionsWrapper
+
+    completions = openai_client.chat.completions
+    if isinstance(completions, (CompletionsWrapper, AsyncCompletionsWrapper)):
+        # Agent frameworks often re-wrap the same client, reuse the existing wrapper
+        # rather than stacking a second layer of supervision on top of it
+        if completions.run_id == run_id and completions.execution_mode == execution_mode:
+            return openai_client
+        completions = completions._completions
+
     try:
         # Get the client from the factory
         client = APIClientFactory.get_client()
 
         supervision_manager = _create_supervision_manager(client)
-        openai_client.chat.completions = CompletionsWrapper(
-            openai_client.chat.completions, supervision_manager, run_id, execution_mode
+        openai_client.chat.completions = wrapper_class(
+            completions, supervision_manager, run_id, execution_mode
         )
         return openai_client
     except Exception as e:
@@ -2,20 +2,28 @@ import datetime
 import unittest
 import uuid
 from abc import ABC
+from typing import Any, List, Tuple
 from unittest.mock import MagicMock
 
+import httpx
+
 from asteroid_sdk.api.api_logger import APILogger
 from asteroid_sdk.api.asteroid_chat_supervision_manager import AsteroidChatSupervisionManager
 from asteroid_sdk.api.generated.asteroid_api_client import Client
-from asteroid_sdk.api.generated.asteroid_api_client.models import Tool, ToolAttributes, ChatIds, ChoiceIds, ToolCallIds, \
+from asteroid_sdk.api.generated.asteroid_api_client.models import Tool, ChatIds, ChoiceIds, ToolCallIds, \
     SupervisorChain, Supervisor, SupervisorType, SupervisorAttributes
 from asteroid_sdk.api.supervision_runner import SupervisionRunner
 from asteroid_sdk.supervision.config import ExecutionMode, RejectionPolicy, MultiSupervisorResolution
 from asteroid_sdk.supervision.helpers.model_provider_helper import ModelProviderHelper
 from tests.acceptance.init_asteroid import InitAsteroidForTestsConfig, init_asteroid_for_tests
 from tests.helper.api.mock_api import make_created_response_with_id, make_ok_response, make_created_response
-from tests.helper.tools.get_weather import get_weather_tool_object_dict
-from tests.helper.tools.google_search import get_google_search_tool_object_dict
+from tests.helper.tools.get_weather import GET_WEATHER_TOOL_ATTRIBUTES, get_weather_tool_object_dict
+from tests.helper.tools.google_search import GOOGLE_SEARCH_TOOL_ATTRIBUTES, get_google_search_tool_object_dict
+
+# Fixed timestamp for mocked API objects, nothing asserts on it
+_MOCK_NOW = datetime.datetime(2024, 1, 1)
+# The fixtures only ever serialise this with to_dict(), so it can be shared
+_EMPTY_SUPERVISOR_ATTRIBUTES = SupervisorAttributes.from_dict({})
 
 
 class AbstractAcceptanceTest(ABC, unittest.TestCase):
@@ -37,83 +45,16 @@ class AbstractAcceptanceTest(ABC, unittest.TestCase):
         )
 
         self.run_id = uuid.uuid4()
+        # The mocked httpx request every API call goes through, tests queue their responses on its side_effect
+        self.request_mock = self.mock_asteroid_client.get_httpx_client.return_value.request
 
     def resamples_then_works_globals(self, mock_get_client, should_add_get_run_call: bool = False):
         """
         Sets up the global mocks for the resamples_then_works test
         """
-        mock_get_client.return_value = self.mock_asteroid_client
-
-        project_id = uuid.uuid4()
-        task_id = uuid.uuid4()
-        weather_tool_and_supervisor_id = uuid.uuid4()
-        search_tool_and_supervisor_id = uuid.uuid4()
-
-        config = InitAsteroidForTestsConfig(
-            project_id,
-            task_id,
-            self.run_id,
-            {
-                "execution_mode": ExecutionMode.SUPERVISION,
-                "allow_tool_modifications": True,
-                "rejection_policy": RejectionPolicy.RESAMPLE_WITH_FEEDBACK,
-                "n_resamples": 3,
-                "multi_supervisor_resolution": MultiSupervisorResolution.ALL_MUST_APPROVE,
-                "remove_feedback_from_context": True,
-            },
-            # NO IDEA WHY but order matters here
-            [get_weather_tool_object_dict(self.run_id, weather_tool_and_supervisor_id),
-             get_google_search_tool_object_dict(self.run_id, search_tool_and_supervisor_id)]
-        )
-
-        init_asteroid_for_tests(self.mock_asteroid_client, config)
-
-        first_chat_id = uuid.uuid4()
-        first_choice_id = uuid.uuid4()
-        first_message_id = uuid.uuid4()
-        first_tool_call_id = uuid.uuid4()
-
-        # asteroid_sdk.api.asteroid_chat_supervision_manager.AsteroidChatSupervisionManager.handle_language_model_interaction
-        # src/asteroid_sdk/api/asteroid_chat_supervision_manager.py:73
-        send_chats_response = make_created_response(
-            ChatIds(
-                chat_id=first_chat_id,
-                choice_ids=[ChoiceIds(
-                    choice_id=str(first_choice_id),
-                    message_id=str(first_message_id),
-                    tool_call_ids=[
-                        ToolCallIds(
-                            tool_call_id=str(first_tool_call_id),
-                            tool_id=str(search_tool_and_supervisor_id),
-                        )
-                    ]
-                )]
-            ).to_dict()
-        )
+        _, search_tool_and_supervisor_id = self.init_asteroid_with_tools(mock_get_client)
 
-        # asteroid_sdk.registration.helper.get_supervisor_chains_for_tool
-        # src/asteroid_sdk/registration/helper.py:370
-        # None of the data in here is particularly relevant to the test (bar ids)- using a Faker would probably be better
-        get_tool_supervisor_chains_response = make_ok_response(
-            [
-                SupervisorChain(
-                    chain_id=search_tool_and_supervisor_id,
-                    supervisors=[Supervisor(
-                        name="test_supervisor",
-                        id=search_tool_and_supervisor_id,
-                        type=SupervisorType.CLIENT_SUPERVISOR,
-                        description="test description",
-                        created_at=datetime.datetime.now(),
-                        code="def test_supervisor(tool_call): return True",
-                        attributes=SupervisorAttributes.from_dict({})
-                    )],
-                ).to_dict()
-            ]
-        )
-
-        # asteroid_sdk.api.supervision_runner.SupervisionRunner.get_tool
-        # src/asteroid_sdk/api/supervision_runner.py:193
-        get_tool_response = make_ok_response(
+        supervision_responses = self.make_supervision_responses(
             Tool(
                 run_id=self.run_id,
                 name="google_search",
@@ -121,57 +62,56 @@ class AbstractAcceptanceTest(ABC, unittest.TestCase):
                 code="def google_search(query_string: str): return f'Searched {query_string}.",
                 id=search_tool_and_supervisor_id,
                 ignored_attributes=[],
-                attributes=ToolAttributes().from_dict({'query_string': "<class 'str'>"})
-            ).to_dict()
-        )
-
-        review_id = uuid.uuid4()
-        # asteroid_sdk.registration.helper.send_supervision_request
-        # src/asteroid_sdk/registration/helper.py:394
-        send_supervision_request_response = make_created_response_with_id(review_id)
-
-        supervision_result_id = uuid.uuid4()
-        # asteroid_sdk.registration.helper.send_supervision_result
-        # src/asteroid_sdk/registration/helper.py:453
-        send_supervision_result__response = make_created_response_with_id(supervision_result_id)
-
-        get_run_response = None
-        if should_add_get_run_call:
-            # asteroid_sdk.registration.helper.get_run
-            # src/asteroid_sdk/registration/helper.py:346
-            get_run_response = make_ok_response(
-                {
-
-                    "id": "123e4567-e89b-12d3-a456-426614174000",
-                    "task_id": "123e4567-e89b-12d3-a456-426614174001",
-                    "created_at": "2023-10-01T12:34:56Z",
-                    "status": "pending",
-                    "result": "Success",
-                    "metadata": {
-                        "key1": "value1",
-                        "key2": "value2"
-                    }
-                }
+                attributes=GOOGLE_SEARCH_TOOL_ATTRIBUTES
             )
+        )
+        send_chats_response, _, _, send_supervision_request_response, send_supervision_result__response = \
+            supervision_responses
 
         # # Setup mock calls to asteroid API for during supervision
         api_responses = []
         if should_add_get_run_call:
-            api_responses.append(get_run_response)
-        api_responses.append(send_chats_response)
-        api_responses.append(get_tool_supervisor_chains_response)
-        api_responses.append(get_tool_response)
-        api_responses.append(send_supervision_request_response)
-        api_responses.append(send_supervision_result__response)
+            api_responses.append(make_get_run_response(result="Success"))
+        api_responses.extend(supervision_responses)
 
+        # The tool and its supervisor chains are cached by the runner, so the resample doesn't fetch them again
         api_responses.append(send_chats_response)
-        api_responses.append(get_tool_supervisor_chains_response)
-        api_responses.append(get_tool_response)
         api_responses.append(send_supervision_request_response)
         api_responses.append(send_supervision_result__response)
-        self.mock_asteroid_client.get_httpx_client.return_value.request.side_effect = api_responses
+        self.request_mock.side_effect = api_responses
 
     def original_response_when_supervision_successful(self, mock_get_client, should_add_get_run_call: bool = False):
+        weather_tool_and_supervisor_id, _ = self.init_asteroid_with_tools(mock_get_client)
+
+        supervision_responses = self.make_supervision_responses(
+            Tool(
+                run_id=self.run_id,
+                name="get_weather",
+                description="Get the weather in a city",
+                code="def get_weather(location: str, unit: str): return f'The weather in {location} is {unit}.",
+                id=weather_tool_and_supervisor_id,
+                ignored_attributes=[],
+                attributes=GET_WEATHER_TOOL_ATTRIBUTES
+            )
+        )
+
+        get_run_response = None
+        if should_add_get_run_call:
+            get_run_response = make_get_run_response()
+        # Setup mock calls to asteroid API for during supervision
+        self.request_mock.side_effect = [
+            get_run_response,
+            *supervision_responses,
+        ]
+
+    def init_asteroid_with_tools(self, mock_get_client) -> Tuple[uuid.UUID, uuid.UUID]:
+        """
+        Runs asteroid_init against the mocked API with the get_weather and google_search tools registered.
+        The same ID is used for each tool and its supervisor and chain.
+
+        Returns:
+            The IDs of the get_weather and google_search tools
+        """
         # Mocking API client from the point it's called in registration
         mock_get_client.return_value = self.mock_asteroid_client
 
@@ -199,23 +139,26 @@ class AbstractAcceptanceTest(ABC, unittest.TestCase):
 
         init_asteroid_for_tests(self.mock_asteroid_client, config)
 
-        first_chat_id = uuid.uuid4()
-        first_choice_id = uuid.uuid4()
-        first_message_id = uuid.uuid4()
-        first_tool_call_id = uuid.uuid4()
+        return weather_tool_and_supervisor_id, search_tool_and_supervisor_id
 
+    def make_supervision_responses(self, tool: Tool) -> List[httpx.Response]:
+        """
+        Builds the API responses for supervising a single call to the given tool, in the order they are requested:
+        sending the chat, fetching the tool's supervisor chains, fetching the tool, then sending the supervision
+        request and result.
+        """
         # asteroid_sdk.api.asteroid_chat_supervision_manager.AsteroidChatSupervisionManager.handle_language_model_interaction
         # src/asteroid_sdk/api/asteroid_chat_supervision_manager.py:73
         send_chats_response = make_created_response(
             ChatIds(
-                chat_id=first_chat_id,
+                chat_id=uuid.uuid4(),
                 choice_ids=[ChoiceIds(
-                    choice_id=str(first_choice_id),
-                    message_id=str(first_message_id),
+                    choice_id=str(uuid.uuid4()),
+                    message_id=str(uuid.uuid4()),
                     tool_call_ids=[
                         ToolCallIds(
-                            tool_call_id=str(first_tool_call_id),
-                            tool_id=str(weather_tool_and_supervisor_id),
+                            tool_call_id=str(uuid.uuid4()),
+                            tool_id=str(tool.id),
                         )
                     ]
                 )]
@@ -224,18 +167,19 @@ class AbstractAcceptanceTest(ABC, unittest.TestCase):
 
         # asteroid_sdk.registration.helper.get_supervisor_chains_for_tool
         # src/asteroid_sdk/registration/helper.py:370
+        # None of the data in here is particularly relevant to the test (bar ids)- using a Faker would probably be better
         get_tool_supervisor_chains_response = make_ok_response(
             [
                 SupervisorChain(
-                    chain_id=weather_tool_and_supervisor_id,
+                    chain_id=tool.id,
                     supervisors=[Supervisor(
                         name="test_supervisor",
-                        id=weather_tool_and_supervisor_id,
+                        id=tool.id,
                         type=SupervisorType.CLIENT_SUPERVISOR,
                         description="test description",
-                        created_at=datetime.datetime.now(),
+                        created_at=_MOCK_NOW,
                         code="def test_supervisor(tool_call): return True",
-                        attributes=SupervisorAttributes.from_dict({})
+                        attributes=_EMPTY_SUPERVISOR_ATTRIBUTES
                     )],
                 ).to_dict()
             ]
@@ -243,51 +187,38 @@ class AbstractAcceptanceTest(ABC, unittest.TestCase):
 
         # asteroid_sdk.api.supervision_runner.SupervisionRunner.get_tool
         # src/asteroid_sdk/api/supervision_runner.py:193
-        get_tool_response = make_ok_response(
-            Tool(
-                run_id=self.run_id,
-                name="get_weather",
-                description="Get the weather in a city",
-                code="def get_weather(location: str, unit: str): return f'The weather in {location} is {unit}.",
-                id=weather_tool_and_supervisor_id,
-                ignored_attributes=[],
-                attributes=ToolAttributes().from_dict({'location': "<class 'str'>", 'unit': "<class 'str'>"})
-            ).to_dict()
-        )
+        get_tool_response = make_ok_response(tool.to_dict())
 
-        review_id = uuid.uuid4()
         # asteroid_sdk.registration.helper.send_supervision_request
         # src/asteroid_sdk/registration/helper.py:394
-        send_supervision_request_response = make_created_response_with_id(review_id)
+        send_supervision_request_response = make_created_response_with_id(uuid.uuid4())
 
-        supervision_result_id = uuid.uuid4()
         # asteroid_sdk.registration.helper.send_supervision_result
         # src/asteroid_sdk/registration/helper.py:453
-        send_supervision_result__response = make_created_response_with_id(supervision_result_id)
-
-        get_run_response = None
-        if should_add_get_run_call:
-            # asteroid_sdk.registration.helper.get_run
-            # src/asteroid_sdk/registration/helper.py:346
-            get_run_response = make_ok_response(
-                {
+        send_supervision_result__response = make_created_response_with_id(uuid.uuid4())
 
-                    "id": "123e4567-e89b-12d3-a456-426614174000",
-                    "task_id": "123e4567-e89b-12d3-a456-426614174001",
-                    "created_at": "2023-10-01T12:34:56Z",
-                    "status": "pending",
-                    "metadata": {
-                        "key1": "value1",
-                        "key2": "value2"
-                    }
-                }
-            )
-        # Setup mock calls to asteroid API for during supervision
-        self.mock_asteroid_client.get_httpx_client.return_value.request.side_effect = [
-            get_run_response,
+        return [
             send_chats_response,
             get_tool_supervisor_chains_response,
             get_tool_response,
             send_supervision_request_response,
-            send_supervision_result__response
+            send_supervision_result__response,
         ]
+
+
+def make_get_run_response(**extra_fields: Any) -> httpx.Response:
+    # asteroid_sdk.registration.helper.get_run
+    # src/asteroid_sdk/registration/helper.py:346
+    return make_ok_response(
+        {
+            "id": "123e4567-e89b-12d3-a456-426614174000",
+            "task_id": "123e4567-e89b-12d3-a456-426614174001",
+            "created_at": "2023-10-01T12:34:56Z",
+            "status": "pending",
+            **extra_fields,
+            "metadata": {
+                "key1": "value1",
+                "key2": "value2"
+            }
+        }
+    )
@@ -4,7 +4,6 @@ from unittest.mock import MagicMock, patch
 
 from anthropic.resources import Messages
 from anthropic.types import Message, Usage, TextBlock, ToolUseBlock
-from openai.types.chat import ChatCompletion
 
 from asteroid_sdk.supervision.config import ExecutionMode
 from asteroid_sdk.supervision.helpers.anthropic_helper import AnthropicSupervisionHelper
@@ -118,7 +117,7 @@ class TestAnthropic(AbstractAcceptanceTest):
             ),
         )
 
-    def create_message_with_tool_calls(self, tool_calls: List[ToolUseBlock]) -> ChatCompletion:
+    def create_message_with_tool_calls(self, tool_calls: List[ToolUseBlock]) -> Message:
         return Message(
             id="test_id",
             content=tool_calls,
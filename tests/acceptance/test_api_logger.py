@@ -0,0 +1,55 @@
+import unittest
+import uuid
+from unittest.mock import MagicMock
+
+import httpx
+from openai.types.chat import ChatCompletion, ChatCompletionMessage
+from openai.types.chat.chat_completion import Choice
+
+from asteroid_sdk.api import api_logger
+from asteroid_sdk.api.api_logger import APILogger
+from asteroid_sdk.api.generated.asteroid_api_client import Client
+from asteroid_sdk.supervision.helpers.openai_helper import OpenAiSupervisionHelper
+
+
+class TestApiLoggerInBackground(unittest.TestCase):
+    def setUp(self):
+        self.mock_asteroid_client = MagicMock(Client)
+        self.request_mock = self.mock_asteroid_client.get_httpx_client.return_value.request
+        self.api_logger = APILogger(self.mock_asteroid_client, OpenAiSupervisionHelper())
+        self.run_id = uuid.uuid4()
+
+    def test_failed_background_log_is_reported(self):
+        self.request_mock.side_effect = httpx.ConnectError("API is unreachable")
+
+        with self.assertLogs(level="WARNING") as logs:
+            future = self.api_logger.log_llm_interaction_in_background(
+                self.create_chat_completion(),
+                {"messages": [{"role": "user", "content": "Hello"}], "model": "test-model"},
+                self.run_id,
+            )
+            self.assertIsInstance(future.exception(timeout=10), httpx.ConnectError)
+            # Done-callbacks run on the single worker before it picks up the next job, so this waits for them
+            api_logger._background_log_executor.submit(lambda: None).result(timeout=10)
+
+        self.assertIn(
+            f"WARNING:root:Failed to log chat for run {self.run_id}: API is unreachable",
+            logs.output
+        )
+
+    def create_chat_completion(self) -> ChatCompletion:
+        return ChatCompletion(
+            id="test_id",
+            created=0,
+            model="test-model",
+            object="chat.completion",
+            choices=[Choice(
+                message=ChatCompletionMessage(content="test response", role="assistant"),
+                finish_reason="stop",
+                index=0,
+            )]
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
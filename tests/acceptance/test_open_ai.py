@@ -1,15 +1,21 @@
+import asyncio
+import time
 import unittest
-from typing import List
-from unittest.mock import MagicMock, patch
+import uuid
+from typing import List, Optional
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import openai.resources.chat
-from openai.types.chat import ChatCompletion, ChatCompletionMessage, ChatCompletionMessageToolCall
+from openai.types.chat import ChatCompletion, ChatCompletionChunk, ChatCompletionMessage, ChatCompletionMessageToolCall
+from openai.types.chat.chat_completion_chunk import Choice as ChunkChoice, ChoiceDelta
 from openai.types.chat.chat_completion import Choice
 from openai.types.chat.chat_completion_message_tool_call import Function
 
+import asteroid_sdk.wrappers.openai as asteroid_openai_wrapper
+from asteroid_sdk.api.generated.asteroid_api_client.models import Decision
 from asteroid_sdk.supervision.config import ExecutionMode
 from asteroid_sdk.supervision.helpers.openai_helper import OpenAiSupervisionHelper
-from asteroid_sdk.wrappers.openai import CompletionsWrapper
+from asteroid_sdk.wrappers.openai import AsyncCompletionsWrapper, CompletionsWrapper, asteroid_openai_client
 from tests.acceptance.abstract_acceptance_test import AbstractAcceptanceTest
 
 
@@ -135,5 +141,179 @@ class TestOpenAi(AbstractAcceptanceTest):
         )
 
 
+class TestAsyncOpenAi(TestOpenAi):
+    def setUp(self):
+        self.setUpGlobal(OpenAiSupervisionHelper())
+        self.mock_completions = MagicMock(openai.resources.chat.AsyncCompletions)
+        self.mock_completions.create = AsyncMock()
+        self.async_openai_wrapper = AsyncCompletionsWrapper(
+            self.mock_completions,
+            self.chat_supervision_manager,
+            self.run_id,
+            ExecutionMode.SUPERVISION
+        )
+        # Drive the async wrapper through the same tests as the sync one
+        self.openai_wrapper = MagicMock()
+        self.openai_wrapper.create.side_effect = self._create
+
+    def _create(self, *args, **kwargs):
+        self.async_openai_wrapper.run_id = self.openai_wrapper.run_id
+        return asyncio.run(self.async_openai_wrapper.create(*args, **kwargs))
+
+    @patch('asteroid_sdk.registration.helper.APIClientFactory.get_client')
+    def test_monitoring_returns_the_response_and_records_the_rejection_without_resampling(self, mock_get_client):
+        self.resamples_then_works_globals(mock_get_client, True)
+        rejected_completion_message = self.create_chat_completion_with_tool_calls(
+            [
+                ChatCompletionMessageToolCall(
+                    id="random_id",
+                    type="function",
+                    function=Function(
+                        name="google_search",
+                        arguments='{"query_string": "is BTC going to the moon", "allow": false}'
+                    )
+                )
+            ]
+        )
+        self.mock_completions.create.return_value = rejected_completion_message
+        self.async_openai_wrapper.run_id = self.run_id
+        self.async_openai_wrapper.execution_mode = ExecutionMode.MONITORING
+
+        messages = [{"role": "user", "content": "Search the internet for 'is BTC going to the moon'"}]
+        # asyncio.run closes the caller's loop as soon as create returns, before supervision has finished
+        response = asyncio.run(
+            self.async_openai_wrapper.create(messages=messages, model="test-model", parallel_tool_calls=False)
+        )
+        wait_for_background_supervision()
+
+        # Then
+        self.assertEqual(response, rejected_completion_message)
+        # Monitoring never resamples, the rejection is only recorded
+        self.mock_completions.create.assert_called_once()
+        supervision_results = [
+            call.kwargs["json"] for call in self.request_mock.call_args_list
+            if call.kwargs["url"].endswith("/result")
+        ]
+        self.assertEqual([result["decision"] for result in supervision_results], [Decision.REJECT.value])
+
+
+def wait_for_background_supervision(timeout: float = 10):
+    deadline = time.monotonic() + timeout
+    while asteroid_openai_wrapper.tasks and time.monotonic() < deadline:
+        time.sleep(0.01)
+    if asteroid_openai_wrapper.tasks:
+        raise AssertionError(f"Background supervision did not finish within {timeout} seconds")
+
+
+class TestOpenAiStreaming(unittest.TestCase):
+    def setUp(self):
+        # Don't look up the run's paused state from the API
+        unpaused_patcher = patch('asteroid_sdk.wrappers.openai.wait_for_unpaused', new_callable=AsyncMock)
+        unpaused_patcher.start()
+        self.addCleanup(unpaused_patcher.stop)
+        self.mock_completions = MagicMock(openai.resources.chat.Completions)
+        self.openai_wrapper = CompletionsWrapper(
+            self.mock_completions,
+            MagicMock(),
+            uuid.uuid4(),
+            ExecutionMode.MONITORING
+        )
+        self.chunks = [
+            self.create_chunk({"role": "assistant", "content": "The weather "}),
+            self.create_chunk({"content": "is sunny"}),
+            self.create_chunk({}, finish_reason="length"),
+        ]
+        self.mock_completions.create.return_value = iter(self.chunks)
+
+    def test_monitoring_passes_chunks_through_then_supervises_the_completion(self):
+        messages = [{"role": "user", "content": "Get me the weather in London"}]
+        with patch.object(self.openai_wrapper, "_schedule_supervision") as schedule_supervision:
+            stream = self.openai_wrapper.create(messages=messages, model="test-model", stream=True)
+
+            # next() works as on openai.Stream, and supervision waits for the end of the stream
+            self.assertIs(next(stream), self.chunks[0])
+            schedule_supervision.assert_not_called()
+            self.assertEqual(list(stream), self.chunks[1:])
+
+        schedule_supervision.assert_called_once()
+        response, _, request_kwargs, _ = schedule_supervision.call_args.args
+        # A plain ChatCompletion, even though the stream was cut short by the length limit
+        self.assertIs(type(response), ChatCompletion)
+        self.assertEqual(response.choices[0].message.content, "The weather is sunny")
+        self.assertEqual(response.choices[0].finish_reason, "length")
+        # Resamples must not be streamed
+        self.assertEqual(request_kwargs, {"messages": messages, "model": "test-model"})
+
+    def test_streaming_is_refused_in_supervision_mode(self):
+        self.openai_wrapper.execution_mode = ExecutionMode.SUPERVISION
+
+        with self.assertRaises(ValueError):
+            self.openai_wrapper.create(messages=[], model="test-model", stream=True)
+        self.mock_completions.create.assert_not_called()
+
+    def test_streaming_is_refused_by_the_async_wrapper(self):
+        mock_completions = MagicMock(openai.resources.chat.AsyncCompletions)
+        mock_completions.create = AsyncMock()
+        async_openai_wrapper = AsyncCompletionsWrapper(
+            mock_completions,
+            MagicMock(),
+            uuid.uuid4(),
+            ExecutionMode.MONITORING
+        )
+
+        with self.assertRaises(ValueError):
+            asyncio.run(async_openai_wrapper.create(messages=[], model="test-model", stream=True))
+        mock_completions.create.assert_not_called()
+
+    def create_chunk(self, delta: dict, finish_reason: Optional[str] = None) -> ChatCompletionChunk:
+        return ChatCompletionChunk(
+            id="test_id",
+            created=0,
+            model="test-model",
+            object="chat.completion.chunk",
+            choices=[ChunkChoice(index=0, delta=ChoiceDelta(**delta), finish_reason=finish_reason)]
+        )
+
+
+@patch('asteroid_sdk.registration.helper.APIClientFactory.get_client')
+class TestAsteroidOpenAiClient(unittest.TestCase):
+    def test_rewrapping_with_the_same_run_and_mode_returns_the_client_unchanged(self, mock_get_client):
+        openai_client = openai.OpenAI(api_key="test")
+        run_id = uuid.uuid4()
+
+        asteroid_openai_client(openai_client, run_id, ExecutionMode.SUPERVISION)
+        wrapper = openai_client.chat.completions
+
+        self.assertIs(asteroid_openai_client(openai_client, run_id, ExecutionMode.SUPERVISION), openai_client)
+        self.assertIs(openai_client.chat.completions, wrapper)
+
+    def test_async_client_is_wrapped_with_the_async_wrapper(self, mock_get_client):
+        openai_client = openai.AsyncOpenAI(api_key="test")
+        original_completions = openai_client.chat.completions
+        run_id = uuid.uuid4()
+
+        self.assertIs(asteroid_openai_client(openai_client, run_id, ExecutionMode.MONITORING), openai_client)
+
+        wrapper = openai_client.chat.completions
+        self.assertIsInstance(wrapper, AsyncCompletionsWrapper)
+        self.assertIs(wrapper._completions, original_completions)
+        self.assertEqual(wrapper.run_id, run_id)
+        self.assertEqual(wrapper.execution_mode, ExecutionMode.MONITORING)
+
+    def test_rewrapping_for_another_run_wraps_the_original_completions(self, mock_get_client):
+        openai_client = openai.OpenAI(api_key="test")
+        original_completions = openai_client.chat.completions
+
+        asteroid_openai_client(openai_client, uuid.uuid4(), ExecutionMode.SUPERVISION)
+        new_run_id = uuid.uuid4()
+        asteroid_openai_client(openai_client, new_run_id, ExecutionMode.SUPERVISION)
+
+        wrapper = openai_client.chat.completions
+        self.assertIsInstance(wrapper, CompletionsWrapper)
+        self.assertEqual(wrapper.run_id, new_run_id)
+        # Not stacked on top of the first wrapper
+        self.assertIs(wrapper._completions, original_completions)
+
+
 if __name__ == '__main__':
     unittest.main()
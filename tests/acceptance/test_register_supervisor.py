@@ -0,0 +1,83 @@
+import unittest
+import uuid
+from unittest.mock import MagicMock, patch
+
+from asteroid_sdk.api.generated.asteroid_api_client import Client
+from asteroid_sdk.api.generated.asteroid_api_client.models import SupervisorType
+from asteroid_sdk.registration.helper import register_supervisor
+from asteroid_sdk.supervision.config import SupervisionContext, get_supervision_config
+from asteroid_sdk.utils.utils import get_function_code
+from tests.helper.api.mock_api import make_created_response_with_id
+from tests.helper.supervisors.allow_all_supervisor import allow_all_supervisor
+
+
+class TestRegisterSupervisor(unittest.TestCase):
+    def setUp(self):
+        get_supervision_config().clear_registered_supervisors()
+        self.mock_asteroid_client = MagicMock(Client)
+        self.request_mock = self.mock_asteroid_client.get_httpx_client.return_value.request
+        self.project_id = uuid.uuid4()
+
+    def register(self, supervision_context: SupervisionContext, **overrides) -> uuid.UUID:
+        kwargs = {
+            "supervisor_name": allow_all_supervisor.__name__,
+            "supervisor_description": "Approves everything",
+            "supervisor_type": SupervisorType.CLIENT_SUPERVISOR,
+            "supervisor_code": get_function_code(allow_all_supervisor),
+            "supervisor_attributes": {},
+            "project_id": self.project_id,
+            "supervisor_func": allow_all_supervisor,
+            "supervision_context": supervision_context,
+        }
+        kwargs.update(overrides)
+        return register_supervisor(**kwargs)
+
+    @patch('asteroid_sdk.registration.helper.APIClientFactory.get_client')
+    def test_supervisor_shared_by_tools_is_created_once(self, mock_get_client):
+        mock_get_client.return_value = self.mock_asteroid_client
+        supervisor_id = uuid.uuid4()
+        self.request_mock.side_effect = [make_created_response_with_id(supervisor_id)]
+
+        first_tool_context = SupervisionContext()
+        second_tool_context = SupervisionContext()
+
+        self.assertEqual(self.register(first_tool_context), supervisor_id)
+        self.assertEqual(self.register(second_tool_context), supervisor_id)
+
+        self.assertEqual(self.request_mock.call_count, 1)
+        # The reused supervisor is still made available to the second tool's context
+        self.assertIs(second_tool_context.get_supervisor_func_by_id(supervisor_id), allow_all_supervisor)
+
+    @patch('asteroid_sdk.registration.helper.APIClientFactory.get_client')
+    def test_supervisor_is_created_again_when_its_definition_differs(self, mock_get_client):
+        mock_get_client.return_value = self.mock_asteroid_client
+        supervisor_ids = [uuid.uuid4() for _ in range(3)]
+        self.request_mock.side_effect = [make_created_response_with_id(i) for i in supervisor_ids]
+
+        supervision_context = SupervisionContext()
+
+        self.assertEqual(self.register(supervision_context), supervisor_ids[0])
+        self.assertEqual(self.register(supervision_context, supervisor_attributes={"threshold": 1}), supervisor_ids[1])
+        self.assertEqual(self.register(supervision_context, supervisor_description="Approves anything"),
+                         supervisor_ids[2])
+
+        self.assertEqual(self.request_mock.call_count, 3)
+
+    @patch('asteroid_sdk.registration.helper.APIClientFactory.get_client')
+    def test_supervisor_is_created_again_after_the_registrations_are_cleared(self, mock_get_client):
+        mock_get_client.return_value = self.mock_asteroid_client
+        supervisor_ids = [uuid.uuid4() for _ in range(2)]
+        self.request_mock.side_effect = [make_created_response_with_id(i) for i in supervisor_ids]
+
+        supervision_context = SupervisionContext()
+
+        self.assertEqual(self.register(supervision_context), supervisor_ids[0])
+        # asteroid_init does this before registering the tools for a new run
+        get_supervision_config().clear_registered_supervisors()
+        self.assertEqual(self.register(supervision_context), supervisor_ids[1])
+
+        self.assertEqual(self.request_mock.call_count, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
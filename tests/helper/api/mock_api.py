@@ -3,13 +3,15 @@ from http import HTTPStatus
 from typing import Any
 
 import httpx
+import orjson
 
 
 def make_response(json: Any, status_code: HTTPStatus):
     return httpx.Response(
         status_code=status_code,
-        headers={},
-        json=json
+        headers={"Content-Type": "application/json"},
+        # Serialise with orjson up front, httpx would otherwise encode the json= argument with the stdlib
+        content=orjson.dumps(json)
     )
 
 def make_created_response_with_id(resource_id: uuid.UUID):
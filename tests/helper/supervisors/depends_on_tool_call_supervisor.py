@@ -1,5 +1,4 @@
-import json
-
+import orjson
 from anthropic.types import Message, ToolUseBlock
 from openai.types.chat import ChatCompletionMessage
 
@@ -11,7 +10,7 @@ from asteroid_sdk.supervision.helpers.model_provider_helper import AvailableProv
 def should_allow(message: AvailableProviderMessageTypes) -> bool:
     if isinstance(message, ChatCompletionMessage):
         args_string = message.tool_calls[0].function.arguments
-        return json.loads(args_string)["allow"]
+        return orjson.loads(args_string)["allow"]
     elif isinstance(message, Message):
         for content_block in message.content:
             if type(content_block) == ToolUseBlock:
@@ -4,6 +4,9 @@ from asteroid_sdk.api.generated.asteroid_api_client.models import Tool, ToolAttr
 from asteroid_sdk.supervision import supervise
 from tests.helper.supervisors.allow_all_supervisor import allow_all_supervisor
 
+# Only ever serialised with to_dict(), so every Tool built here can share it
+GET_WEATHER_TOOL_ATTRIBUTES = ToolAttributes.from_dict({'location': "<class 'str'>", 'unit': "<class 'str'>"})
+
 
 @supervise(supervision_functions=[[allow_all_supervisor]])
 def get_weather(location: str, unit: str):
@@ -18,5 +21,5 @@ def get_weather_tool_object_dict(run_id: uuid.UUID, tool_id: uuid.UUID) -> Tool:
         code="def get_weather(location: str, unit: str): return f'The weather in {location} is {unit}.'",
         id=tool_id,
         ignored_attributes=[],
-        attributes=ToolAttributes().from_dict({'location': "<class 'str'>",'unit': "<class 'str'>"})
+        attributes=GET_WEATHER_TOOL_ATTRIBUTES
     )
@@ -4,6 +4,9 @@ from asteroid_sdk.api.generated.asteroid_api_client.models import Tool, ToolAttr
 from asteroid_sdk.supervision import supervise
 from tests.helper.supervisors.depends_on_tool_call_supervisor import depends_on_tool_call_supervisor
 
+# Only ever serialised with to_dict(), so every Tool built here can share it
+GOOGLE_SEARCH_TOOL_ATTRIBUTES = ToolAttributes.from_dict({'query_string': "<class 'str'>"})
+
 
 @supervise(supervision_functions=[[depends_on_tool_call_supervisor]])
 def google_search(query_string: str):
@@ -18,5 +21,5 @@ def get_google_search_tool_object_dict(run_id: uuid.UUID, tool_id: uuid.UUID) ->
         code="def google_search(query_string: str): return f'Searched {query_string}.'",
         id=tool_id,
         ignored_attributes=[],
-        attributes=ToolAttributes().from_dict({'query_string': "<class 'str'>"})
+        attributes=GOOGLE_SEARCH_TOOL_ATTRIBUTES
     )